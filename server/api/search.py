@@ -1,7 +1,8 @@
-from schema.search import SearchRequest, SearchResponse, SearchResult
+from schema.search import SearchRequest, SearchResponse
 from core.logger import get_logger
 from services.search_service import search_service
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 
 router = APIRouter(prefix="/search")
 logger = get_logger(__name__)
@@ -11,11 +12,14 @@ logger = get_logger(__name__)
 async def search(payload: SearchRequest):
     logger.info(f"Search Starting |query:{payload.query}| limit:{payload.limit}")
     
-    results = search_service(query=payload.query, limit=payload.limit)
+    # Embedding + DB work is blocking; keep it off the event loop
+    results = await run_in_threadpool(search_service, query=payload.query, limit=payload.limit)
     
     logger.info(f"Search completed successfully result_count:{len(results)}")
-    return SearchResponse(
-        query=payload.query,
-        total=len(results),
-        results=[SearchResult(**r) for r in results]
-    )
\ No newline at end of file
+    # Return plain data: response_model validates and serializes it to JSON
+    # bytes in one Pydantic pass instead of building SearchResult models twice
+    return {
+        "query": payload.query,
+        "total": len(results),
+        "results": results,
+    }
\ No newline at end of file
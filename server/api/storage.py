@@ -2,12 +2,25 @@ from schema.storage import StorageRequest, ErrorResponse, SuccessfulResponse
 from core.logger import get_logger
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from services.storage_service import storage_service
+from db.postgres_db import try_advisory_lock
 from opentelemetry import trace
 
 router = APIRouter(prefix="/store")
 logger = get_logger(__name__)
 
+# Advisory lock key that makes ingestion single-flight across threads and workers
+INGEST_LOCK_KEY = 0x5C09E
+
+
+def _locked_storage_service(**kwargs):
+    # Returns None when another ingestion already holds the lock
+    with try_advisory_lock(INGEST_LOCK_KEY) as acquired:
+        if not acquired:
+            return None
+        return storage_service(**kwargs)
+
 
 @router.post("/")
 async def storage(payload: StorageRequest, request: Request):
@@ -43,7 +56,17 @@ async def storage(payload: StorageRequest, request: Request):
         )
     
     try:
-        papers=storage_service(pub_year=pub_year, per_page=per_page,limit=limit)
+        papers=await run_in_threadpool(_locked_storage_service, pub_year=pub_year, per_page=per_page,limit=limit)
+        if papers is None:
+            logger.info("Storage Service already running, rejecting request")
+            return JSONResponse(
+                status_code=409,
+                content=ErrorResponse(
+                    error_code="INGESTION_IN_PROGRESS",
+                    message="another ingestion run is in progress, try again once it finishes.",
+                    details={}
+                ).model_dump()
+            )
         return JSONResponse(
             status_code=200,
             content=SuccessfulResponse(
@@ -1,6 +1,9 @@
 from core.config import settings
+from core.logger import logger
 
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 # models
@@ -21,5 +24,27 @@ def init_db():
 def clear_db():
     Base.metadata.drop_all(engine)
 
+@contextmanager
+def try_advisory_lock(key: int):
+    """Yield whether a session-level Postgres advisory lock on `key` was taken.
+
+    The lock lives on one pooled connection, so it is shared across threads and
+    worker processes, and Postgres drops it if the process dies mid-run.
+    """
+    # AUTOCOMMIT so the connection is not left idle in a transaction (and
+    # killed by idle_in_transaction_session_timeout) for the whole run
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                # Best effort: a failed unlock must not mask the caller's result,
+                # and a dropped connection has released the lock already
+                try:
+                    conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                except Exception:
+                    logger.exception("Failed to release advisory lock %d", key)
+
 if __name__ == "__main__":
     init_db()
\ No newline at end of file
@@ -8,7 +8,12 @@ from qdrant_client.models import (
     PointStruct,
     Prefetch,
     FusionQuery,
-    Fusion
+    Fusion,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    QuantizationSearchParams,
 )
 
 
@@ -20,6 +25,11 @@ TITLE_DIM = 384
 ABSTRACT_DIM = 768
 CONTRIBUTION_DIM = 768
 
+# int8 scalar quantization: ~4x smaller index; the top candidates are
+# rescored against the original float vectors to keep ranking quality
+QUANTIZATION_QUANTILE = 0.99
+QUANTIZATION_OVERSAMPLING = 2.0
+
 
 class QdrantDB:
     def __init__(self):
@@ -34,6 +44,13 @@ class QdrantDB:
                 "abstract": VectorParams(size=ABSTRACT_DIM, distance=Distance.COSINE),
                 "contribution": VectorParams(size=CONTRIBUTION_DIM, distance=Distance.COSINE),
             },
+            quantization_config=ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=QUANTIZATION_QUANTILE,
+                    always_ram=True,
+                ),
+            ),
         )
     
     def delete_collection(self):
@@ -83,7 +100,6 @@ class QdrantDB:
                 limit=limit,
                 with_payload=True,
             )
-            print(results)
             return [
                 {
                     "id": hit.id,
@@ -100,21 +116,30 @@ class QdrantDB:
         self,
         query_vectors: Dict[str, List[float]],
     ):
+        params = SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=True,
+                oversampling=QUANTIZATION_OVERSAMPLING,
+            ),
+        )
         return [
                 Prefetch(
                     query=query_vectors.get("title", []),
                     using="title",
                     limit=50,
+                    params=params,
                 ),
                 Prefetch(
                     query=query_vectors.get("abstract", []),
                     using="abstract",
                     limit=50,
+                    params=params,
                 ),
                 Prefetch(
                     query=query_vectors.get("contribution", []),
                     using="contribution",
                     limit=50,
+                    params=params,
                 ),
             ]
 
@@ -127,7 +152,8 @@ class QdrantDB:
         try:
             results = self.client.query_points(
                 collection_name=settings.QDRANT_COLLECTION_NAME,
-                query=self._build_rrf_query(query_vectors),
+                prefetch=self._build_prefetches(query_vectors),
+                query=FusionQuery(fusion=Fusion.RRF),
                 query_filter=filter_query,
                 limit=limit,
                 with_payload=True,
@@ -138,8 +164,19 @@ class QdrantDB:
                     "score": hit.score,
                     "payload": hit.payload,
                 }
-                for hit in results
+                for hit in results.points
             ]
         except Exception as e:
             logger.error(f"Vector search with filter failed: {e}")
             return []
+
+
+_qdrant_db = None
+
+
+def get_qdrant_db() -> QdrantDB:
+    """Process-wide QdrantDB so the HTTP client and its connection pool are reused."""
+    global _qdrant_db
+    if _qdrant_db is None:
+        _qdrant_db = QdrantDB()
+    return _qdrant_db
@@ -17,6 +17,9 @@ class CitationEdgeRepository:
     def get_all(self) -> list[CitationEdge]:
         return self.db.query(CitationEdge).all()
 
+    def get_all_id_pairs(self) -> list[tuple[str, str]]:
+        return self.db.query(CitationEdge.citing_id, CitationEdge.cited_id).all()
+
     def insert(self, citation_edge: CitationEdge) -> CitationEdge:
         self.db.add(citation_edge)
         self.db.commit()
@@ -1,7 +1,7 @@
 from typing import Optional, List, Dict, Any
 from core.logger import logger
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from ..models.papers import Paper  
 
 class PaperRepository:
@@ -21,6 +21,16 @@ class PaperRepository:
     def get_by_oa_id(self, oa_id: str) -> Optional[Paper]:
         return self.db.query(Paper).filter(Paper.openalex_id == oa_id).first()
 
+    def get_by_oa_ids(self, oa_ids: List[str]) -> list[Paper]:
+        if not oa_ids:
+            return []
+        return self.db.query(Paper).filter(Paper.openalex_id.in_(oa_ids)).all()
+
+    def get_pr_scores(self) -> list[tuple[str, float]]:
+        # (openalex_id, pr_score) for papers that already have a PageRank score
+        stmt = select(Paper.openalex_id, Paper.pr_score).where(Paper.pr_score > 0)
+        return [tuple(row) for row in self.db.execute(stmt).all()]
+
     def insert(self, paper_data: dict) -> Paper:
         paper = Paper(**paper_data)
 
@@ -59,6 +69,18 @@ class PaperRepository:
         self.db.refresh(paper)
         return paper
 
+    def bulk_update_velocity(self, velocities: List[List]) -> None:
+        if not velocities:
+            return
+        self.db.execute(
+            update(Paper),
+            [
+                {"openalex_id": paper_id, "velocity_score": cv, "needs_vel": False}
+                for paper_id, cv in velocities
+            ],
+        )
+        self.db.commit()
+
     def search_papers_bm25(
         self,
         query: str,
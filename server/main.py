@@ -4,7 +4,8 @@ from api import search
 from api import storage
 from contextlib import asynccontextmanager
 from db.postgres_db import init_db, clear_db
-from db.qdrant_db import QdrantDB
+from db.qdrant_db import QdrantDB, get_qdrant_db
+from utils.embedding_util import warm_models
 from core.logger import get_logger
 import time
 import uuid
@@ -15,6 +16,10 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting application")
+    # Create the shared Qdrant client up front instead of on the first request
+    get_qdrant_db()
+    # Load + warm the embedding models so the first search doesn't pay for it
+    warm_models()
     
     # init_db()
     # qdrant = QdrantDB()
@@ -15,11 +15,14 @@ TAGS_MAX_WORDS = 10
 CONTRIBUTION_MAX_WORDS = 20
 REQUEST_INTERVAL_SECONDS = 2.1
 
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
 def _extractive_contribution(abstract: str) -> str:
     if not abstract or not abstract.strip():
         return "Contribution unavailable."
 
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', abstract.strip())
+    # Only the first two sentences are ever used, so stop splitting there
+    sentences = _SENTENCE_SPLIT_RE.split(abstract.strip(), maxsplit=2)
     source = sentences[1] if len(sentences) > 1 else sentences[0]
     source = source.strip()
 
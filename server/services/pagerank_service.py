@@ -1,4 +1,5 @@
-import igraph as ig
+import numpy as np
+import scipy.sparse as sp
 from datetime import datetime
 from typing import List
 
@@ -12,36 +13,103 @@ def _build_citation_graph():
     session = SessionLocal()
     try:
         cer = CitationEdgeRepository(session)
-        raw_data = cer.get_all()
+        # (citing_id, cited_id) rows only — no ORM objects for the whole edge table
+        id_pairs = cer.get_all_id_pairs()
     finally:
         session.close()
 
-    if not raw_data:
+    if not id_pairs:
         logger.warning("No citation edges found — skipping graph build")
         return [], None
 
-    node_set = set()
-    for edge in raw_data:
-        node_set.add(edge.citing_id)
-        node_set.add(edge.cited_id)
+    # Hash every endpoint id to a dense node index in one pass over the rows;
+    # dict lookups are O(E), unlike sorting the ids with np.unique
+    node_to_idx: dict[str, int] = {}
+    n_edges = len(id_pairs)
+    edge_idx = np.fromiter(
+        (node_to_idx.setdefault(uid, len(node_to_idx)) for pair in id_pairs for uid in pair),
+        dtype=np.int32,
+        count=2 * n_edges,
+    ).reshape(n_edges, 2)
+    citing_idx, cited_idx = edge_idx[:, 0], edge_idx[:, 1]
 
-    node_list = list(node_set)
-    node_to_idx = {uid: idx for idx, uid in enumerate(node_list)}
+    node_list = list(node_to_idx)
+    n = len(node_list)
+    # Row = citing paper, column = cited paper; duplicate edges are summed
+    adjacency = sp.csr_matrix(
+        (np.ones(n_edges), (citing_idx, cited_idx)),
+        shape=(n, n),
+    )
 
-    edges = [(node_to_idx[e.citing_id], node_to_idx[e.cited_id]) for e in raw_data]
-    graph = ig.Graph(n=len(node_list), edges=edges, directed=True)
-
-    return node_list, graph
+    return node_list, adjacency
 
 
 # PageRank
-def calculate_global_pr() -> list[list]:
+def _pagerank(
+    adjacency: sp.csr_matrix,
+    damping: float = 0.85,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    x0: np.ndarray | None = None,
+) -> np.ndarray:
+    """Power-iteration PageRank. Normalises `adjacency` in place."""
+    n = adjacency.shape[0]
+
+    # Row-normalise by scaling the CSR data in place, so no second E-sized
+    # transition matrix is allocated; dangling rows stay zero
+    out_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = np.flatnonzero(out_degree == 0)
+    inv_degree = np.zeros(n)
+    linked = out_degree > 0
+    inv_degree[linked] = 1.0 / out_degree[linked]
+    adjacency.data *= np.repeat(inv_degree, np.diff(adjacency.indptr))
+    transition_t = adjacency.T  # CSC view of the same buffers
+
+    # Power iteration; dangling mass is spread uniformly (same as igraph/PRPACK)
+    teleport = (1.0 - damping) / n
+    x = np.full(n, 1.0 / n) if x0 is None else x0 / x0.sum()
+    for _ in range(max_iter):
+        nxt = transition_t @ x
+        nxt += x[dangling].sum() / n
+        nxt *= damping
+        nxt += teleport
+        delta = np.abs(nxt - x).sum()
+        x = nxt
+        if delta < n * tol:
+            break
+
+    return x / x.sum()
+
+
+def _stored_pr_start(node_list: list[str]) -> np.ndarray | None:
+    # Seed from the scores already persisted in Postgres; cited works outside
+    # the corpus (and new papers) have none and start at 1/n
+    session = SessionLocal()
+    try:
+        stored = dict(PaperRepository(session).get_pr_scores())
+    finally:
+        session.close()
+
+    if not stored:
+        return None
+    fallback = 1.0 / len(node_list)
+    return np.fromiter(
+        (stored.get(paper_id, fallback) for paper_id in node_list),
+        dtype=np.float64,
+        count=len(node_list),
+    )
+
+
+def calculate_global_pr(damping: float = 0.85) -> list[list]:
     """Compute PageRank scores for every paper in the citation graph."""
-    node_list, graph = _build_citation_graph()
-    if graph is None:
+    node_list, adjacency = _build_citation_graph()
+    if adjacency is None:
         return []
 
-    pr_scores = graph.pagerank(damping=0.85)
+    # Warm-start from the last persisted scores: after an incremental ingest
+    # most scores barely move, so the iteration converges in far fewer steps
+    x0 = _stored_pr_start(node_list)
+    pr_scores = _pagerank(adjacency, damping=damping, x0=x0).tolist()
 
     return [[node_list[idx], score] for idx, score in enumerate(pr_scores)]
 
@@ -99,29 +167,29 @@ def _weighted_slope(yearly_counts: list[dict], decay: float = 0.7) -> float:
     return max(0.0,round(slope, 6))
 
 
+def _paper_velocity(counts) -> float:
+    # counts_by_year is JSONB — may be None, a list, or empty
+    if not counts or not isinstance(counts, list):
+        return 0.0
+    return _weighted_slope(counts)
+
+
 def calculate_citation_velocity() -> list[list]:
     session = SessionLocal()
     try:
         paper_repo = PaperRepository(session)
         papers = paper_repo.get_all_need_vel()  # papers that still need ranking updates
-
-        results = []
-        for paper in papers:
-            counts = paper.counts_by_year
-            # counts_by_year is JSONB — may be None, a list, or empty
-            if not counts or not isinstance(counts, list):
-                velocity = 0.0
-            else:
-                velocity = _weighted_slope(counts)
-
-            results.append([paper.openalex_id, velocity])
-
-        logger.info("Calculated citation velocity for %d papers", len(results))
-        return results
-
+        paper_ids = [paper.openalex_id for paper in papers]
+        counts = [paper.counts_by_year for paper in papers]
     finally:
         session.close()
 
+    velocities = [_paper_velocity(c) for c in counts]
+
+    results = [[paper_id, velocity] for paper_id, velocity in zip(paper_ids, velocities)]
+    logger.info("Calculated citation velocity for %d papers", len(results))
+    return results
+
 
 def update_citation_velocity():
     cv_data = calculate_citation_velocity()
@@ -132,8 +200,8 @@ def update_citation_velocity():
     session = SessionLocal()
     try:
         paper_repo = PaperRepository(session)
-        for paper_id, velocity in cv_data:
-            paper_repo.update_velocity_by_id(paper_id, velocity)
+        # One executemany UPDATE + one commit, instead of a query and commit per paper
+        paper_repo.bulk_update_velocity(cv_data)
         logger.info("Updated citation velocity for %d papers", len(cv_data))
     except Exception:
         session.rollback()
@@ -3,17 +3,31 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy import text
 
 from db.postgres_db import SessionLocal
-from db.qdrant_db import QdrantDB
+from db.qdrant_db import get_qdrant_db
 from utils.embedding_util import embed_query
 from db.repo.papers import PaperRepository
 from db.models.papers import Paper
 from utils.score_fusion_util import fuse_results
+from utils.cache_util import TTLCache
 
 logger = get_logger(__name__)
 
 DEFAULT_LIMIT = 20
 DEFAULT_VECTOR_LIMIT = 100
 DEFAULT_KEYWORD_LIMIT = 100
+SEARCH_CACHE_SIZE = 512
+# Short TTL on purpose: the cache is per worker process, and clear_search_cache()
+# only runs in the worker that did the ingest. Other workers (and writes from
+# scripts like seed_db) can serve rankings up to this many seconds old.
+SEARCH_CACHE_TTL_SEC = 60
+
+_search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL_SEC)
+
+
+def clear_search_cache():
+    """Drop cached search results, e.g. after new papers are ingested."""
+    _search_cache.clear()
+
 
 def search_service(
     query: str,
@@ -21,10 +35,16 @@ def search_service(
 ) -> List[Dict[str, Any]]:
     logger.info(f"Starting search pipeline for query: {query[:50]}...")
 
+    cache_key = (query, limit)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Search cache hit")
+        return cached
+
     query_vectors = embed_query(query)
     logger.info("Query embedded")
 
-    qdrant=QdrantDB()
+    qdrant=get_qdrant_db()
     vector_results = qdrant.search(
         query_vectors=query_vectors,
         limit=DEFAULT_VECTOR_LIMIT,
@@ -45,7 +65,9 @@ def search_service(
         [r for r in vector_candidate_ids] + [r["id"] for r in keyword_results]
     ))
 
-    pr_scores, velocity_scores = _fetch_scores(all_paper_ids)
+    # Load every candidate row once; scoring and display details both read from it
+    papers = _fetch_papers(all_paper_ids)
+    pr_scores, velocity_scores = _fetch_scores(papers)
     logger.info(f"Fetched PR and velocity scores for {len(pr_scores)} papers")
 
     fused_results = fuse_results(
@@ -53,84 +75,84 @@ def search_service(
         keyword_results=keyword_results,
         pr_scores=pr_scores,
         velocity_scores=velocity_scores,
+        limit=limit,
     )
     logger.info(f"Fused results: {len(fused_results)} papers")
 
     vector_payloads ={r["payload"]["paper id"]: r["payload"] for r in vector_results}
 
     final_results = _fetch_display_details(
-        fused_results[:limit],
+        fused_results,
+        papers=papers,
         vector_payloads=vector_payloads
     )
     logger.info(f"Search complete. Returning {len(final_results)} results")
 
+    # Empty results usually mean a backend hiccup; don't pin them in the cache
+    if final_results:
+        _search_cache.set(cache_key, final_results)
     return final_results
 
-def _fetch_scores(
+def _fetch_papers(
     paper_ids: List[str],
-) -> tuple[Dict[str, float], Dict[str, float]]:
+) -> Dict[str, Paper]:
     if not paper_ids:
-        return {}, {}
+        return {}
 
     session = SessionLocal()
     try:
         paper_repo=PaperRepository(session)
-        pr_scores = {}
-        velocity_scores = {}
-        for id in paper_ids:
-            paper=paper_repo.get_by_oa_id(oa_id=id)
-            doc_id = paper.openalex_id
-            pr_scores[doc_id]= paper.pr_score
-            velocity_scores[doc_id]= paper.velocity_score
-        return pr_scores, velocity_scores
+        return {paper.openalex_id: paper for paper in paper_repo.get_by_oa_ids(paper_ids)}
     except Exception as e:
-        logger.error(f"Failed to fetch scores: {e}")
-        return {}, {}
+        logger.error(f"Failed to fetch papers: {e}")
+        return {}
     finally:
         session.close()
 
+def _fetch_scores(
+    papers: Dict[str, Paper],
+) -> tuple[Dict[str, float], Dict[str, float]]:
+    pr_scores = {}
+    velocity_scores = {}
+    for doc_id, paper in papers.items():
+        pr_scores[doc_id]= paper.pr_score
+        velocity_scores[doc_id]= paper.velocity_score
+    return pr_scores, velocity_scores
+
 def _fetch_display_details(
     paper_results: List[Dict[str, Any]],
+    papers: Dict[str, Paper],
     vector_payloads: Dict[str, Dict]={}
 ) -> List[Dict[str, Any]]:
     if not paper_results:
         return []
 
-    paper_ids = [r["id"] for r in paper_results]
     score_map = {r["id"]: r for r in paper_results}
-    session = SessionLocal()
-    try:
-        paper_repo=PaperRepository(session)
-        result =[]
-        details = []
-        for id in paper_ids: 
-            paper=paper_repo.get_by_oa_id(oa_id=id)
-            if paper is None:
-                continue
-            payload = vector_payloads.get(paper.openalex_id, {})
-            details.append({
-                "openalex_id": paper.openalex_id,
-                "doi": paper.doi,
-                "title": paper.title,
-                "abstract": paper.abstract,
-                "venue": paper.venue,
-                "year": paper.year,
-                "fields": payload.get("fields") or paper.fields,
-                "authors":paper.authors,
-                "contribution": payload.get("contribution",""),
-                "citation_count": paper.citation_count,
-                "relevancy_score": score_map.get(paper.openalex_id,{}).get("relevancy",0.0),
-                "B25_score": score_map.get(paper.openalex_id,{}).get("BM25",0.0),
-                "pr_score": score_map.get(paper.openalex_id,{}).get("pr_score",0.0),
-                "velocity_score": score_map.get(paper.openalex_id,{}).get("velocity_score",0.0),
-                "final_score": score_map.get(paper.openalex_id, {}).get("score",0.0),
-            })
-        return sorted(details, key=lambda x: x["final_score"], reverse=True)
-    except Exception as e:
-        logger.error(f"Failed to fetch display details: {e}")
-        return []
-    finally:
-        session.close()
+    details = []
+    for r in paper_results:
+        paper = papers.get(r["id"])
+        if paper is None:
+            continue
+        payload = vector_payloads.get(paper.openalex_id, {})
+        scores = score_map.get(paper.openalex_id, {})
+        details.append({
+            "openalex_id": paper.openalex_id,
+            "doi": paper.doi,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "venue": paper.venue,
+            "year": paper.year,
+            "fields": payload.get("fields") or paper.fields,
+            "authors":paper.authors,
+            "contribution": payload.get("contribution",""),
+            "citation_count": paper.citation_count,
+            "relevancy_score": scores.get("relevancy",0.0),
+            "B25_score": scores.get("BM25",0.0),
+            "pr_score": scores.get("pr_score",0.0),
+            "velocity_score": scores.get("velocity_score",0.0),
+            "final_score": scores.get("score",0.0),
+        })
+    return sorted(details, key=lambda x: x["final_score"], reverse=True)
 
 
 if __name__ == "__main__":
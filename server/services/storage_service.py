@@ -4,12 +4,13 @@ from services.enrich_service import enrich_paper
 from schema.enrich import EnrichmentResult
 from services.api_harvest_service import stream_data
 from services.pagerank_service import update_global_pr, update_citation_velocity
+from services.search_service import clear_search_cache
 
 from db.repo.papers import PaperRepository
 from db.repo.citation_edges import CitationEdgeRepository
 from db.repo.author_scores import AuthorScoreRepository
 from db.postgres_db import SessionLocal
-from db.qdrant_db import QdrantDB
+from db.qdrant_db import get_qdrant_db
 from db.models.citation_edges import CitationEdge
 from db.models.author_scores import AuthorScore
 
@@ -120,7 +121,7 @@ def _store_qdrant(
     ):
     logger.info("Embedding paper into Qdrant",)
     try:
-        qdrant = QdrantDB()
+        qdrant = get_qdrant_db()
         # embed vectors
         title_vectors = embed_title(title)
         abstract_vectors     = embed_abstract(abstract)
@@ -172,6 +173,7 @@ def storage_service(pub_year: int = 2026, limit: int = 100, per_page: int=200, S
     update_global_pr()
     update_citation_velocity()
     logger.info("Ranking scores updated")
+    clear_search_cache()
     logger.info("Storage complete")
     return {"ingested":count}
 
@@ -0,0 +1,75 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+from core.logger import logger
+
+
+class MicroBatcher:
+    """Coalesces concurrent single-item calls into one batched call.
+
+    Callers block in `submit` while a background thread collects items for up
+    to `max_wait_ms` (or until `max_batch_size` is reached) and runs `fn` once
+    on the whole batch. If the batched call fails, each item is retried on its
+    own so one bad input cannot fail its neighbours.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        timeout_s: float = 30.0,
+    ):
+        self._fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.timeout = timeout_s
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, item: Any) -> Any:
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((item, future))
+        # Bounded so a stalled worker thread cannot hang request threads forever
+        return future.result(timeout=self.timeout)
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                results = self._fn([item for item, _ in batch])
+            except Exception:
+                logger.exception("Batched call failed for %d items, retrying one by one", len(batch))
+                for item, future in batch:
+                    self._run_single(item, future)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def _run_single(self, item: Any, future: Future) -> None:
+        try:
+            future.set_result(self._fn([item])[0])
+        except Exception as e:
+            future.set_exception(e)
@@ -1,58 +1,128 @@
 import os
+import threading
+import numpy as np
+import torch
+from functools import lru_cache
 from sentence_transformers import SentenceTransformer
 from core.config import settings
 from core.logger import logger
+from utils.batch_util import MicroBatcher
 
 EMBED_BATCH_SIZE = 32
+QUERY_CACHE_SIZE = 1024
+QUERY_BATCH_WAIT_MS = 5.0
 MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
+DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
 _minilm_model = None
 _specter2_model = None
+# Models are published only after _prepare, so threads never see a half-converted one
+_minilm_lock = threading.Lock()
+_specter2_lock = threading.Lock()
+
+
+def _prepare(model: SentenceTransformer) -> SentenceTransformer:
+    # FP16 on GPU halves memory traffic; CPU stays FP32
+    if DEVICE == "cuda":
+        model.half()
+    # Pay tokenizer / kernel warm-up at load time, not on the first request
+    _encode(model, ["warmup"])
+    return model
+
+
+def _encode(model: SentenceTransformer, texts: list[str]):
+    with torch.inference_mode():
+        return model.encode(texts, batch_size=EMBED_BATCH_SIZE, convert_to_numpy=True)
 
 
 def get_minilm():
     global _minilm_model
     if _minilm_model is None:
-        logger.info("Loading MiniLM model...")
-        local_path = os.path.join(MODELS_DIR, "all-MiniLM-L6-v2")
-        if os.path.exists(local_path):
-            logger.info(f"Loading MiniLM from local path: {local_path}")
-            _minilm_model = SentenceTransformer(local_path)
-        else:
-            logger.info("Local MiniLM not found, downloading from HF...")
-            _minilm_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        with _minilm_lock:
+            if _minilm_model is None:
+                logger.info("Loading MiniLM model...")
+                local_path = os.path.join(MODELS_DIR, "all-MiniLM-L6-v2")
+                if os.path.exists(local_path):
+                    logger.info(f"Loading MiniLM from local path: {local_path}")
+                    model = SentenceTransformer(local_path, device=DEVICE)
+                else:
+                    logger.info("Local MiniLM not found, downloading from HF...")
+                    model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device=DEVICE)
+                _minilm_model = _prepare(model)
     return _minilm_model
 
 
 def get_specter2():
     global _specter2_model
     if _specter2_model is None:
-        logger.info("Loading SPECTER2 model...")
-        local_path = os.path.join(MODELS_DIR, "specter2_base")
-        if os.path.exists(local_path):
-            logger.info(f"Loading SPECTER2 from local path: {local_path}")
-            _specter2_model = SentenceTransformer(local_path)
-        else:
-            logger.info("Local SPECTER2 not found, downloading from HF...")
-            _specter2_model = SentenceTransformer("allenai/specter2_base")
+        with _specter2_lock:
+            if _specter2_model is None:
+                logger.info("Loading SPECTER2 model...")
+                local_path = os.path.join(MODELS_DIR, "specter2_base")
+                if os.path.exists(local_path):
+                    logger.info(f"Loading SPECTER2 from local path: {local_path}")
+                    model = SentenceTransformer(local_path, device=DEVICE)
+                else:
+                    logger.info("Local SPECTER2 not found, downloading from HF...")
+                    model = SentenceTransformer("allenai/specter2_base", device=DEVICE)
+                _specter2_model = _prepare(model)
     return _specter2_model
 
 
 def embed_title(title: str) -> list[float]:
-    return get_minilm().encode([title])[0].tolist()
+    return _encode(get_minilm(), [title])[0].tolist()
 
 
 def embed_abstract(abstract: str) -> list[float]:
-    return get_specter2().encode([abstract])[0].tolist()
+    return _encode(get_specter2(), [abstract])[0].tolist()
 
 
 def embed_contribution(contribution: str) -> list[float]:
-    return get_specter2().encode([contribution])[0].tolist()
+    return _encode(get_specter2(), [contribution])[0].tolist()
+
+
+def warm_models():
+    """Load and warm both embedding models, e.g. at application startup."""
+    get_minilm()
+    get_specter2()
+
+
+def _frozen(vector) -> np.ndarray:
+    # Own float32 copy (not a view into the batch output), read-only so the
+    # cached entry can be shared safely between callers
+    vector = np.array(vector, dtype=np.float32)
+    vector.setflags(write=False)
+    return vector
+
+
+def _embed_query_batch(queries: list[str]) -> list[tuple[np.ndarray, np.ndarray]]:
+    # abstract and contribution share SPECTER2, so each query is encoded once for both
+    title_vectors = _encode(get_minilm(), queries)
+    specter2_vectors = _encode(get_specter2(), queries)
+    return [(_frozen(t), _frozen(s)) for t, s in zip(title_vectors, specter2_vectors)]
+
+
+# Concurrent searches (one per worker thread) share a single forward pass
+_query_batcher = MicroBatcher(
+    _embed_query_batch,
+    max_batch_size=EMBED_BATCH_SIZE,
+    max_wait_ms=QUERY_BATCH_WAIT_MS,
+)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _embed_query_cached(query: str) -> tuple[np.ndarray, np.ndarray]:
+    # Load the models in the calling thread, so a cold start (download, load,
+    # warm-up) never counts against the batcher's result timeout
+    warm_models()
+    return _query_batcher.submit(query)
 
 
 def embed_query(query: str) -> dict[str, list[float]]:
+    # Cached as read-only float32 arrays (~4.5 KB per query); callers get fresh lists
+    title_vector, specter2_vector = _embed_query_cached(query)
     return {
-        "title": get_minilm().encode([query])[0].tolist(),
-        "abstract": get_specter2().encode([query])[0].tolist(),
-        "contribution": get_specter2().encode([query])[0].tolist(),
+        "title": title_vector.tolist(),
+        "abstract": specter2_vector.tolist(),
+        "contribution": specter2_vector.tolist(),
     }
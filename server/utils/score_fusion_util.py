@@ -85,56 +85,53 @@ def fuse_results(
     keyword_weight: float = 0.3,
     pr_weight: float = 0.2,
     velocity_weight: float = 0.1,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
 
-    weights = {
-        "vector": vector_weight,
-        "keyword": keyword_weight,
-        "pr": pr_weight,
-        "velocity": velocity_weight,
-    }
+    weights = np.array([vector_weight, keyword_weight, pr_weight, velocity_weight])
+
+    # id -> score lookups; reversed so the first (best) hit per paper wins
+    vector_map = {str(r["payload"]["paper id"]): r.get("score", 0.0) for r in reversed(vector_results)}
+    keyword_map = {str(r["id"]): r.get("score", 0.0) for r in reversed(keyword_results)}
 
     # Collect all document ids
-    vector_ids = [str(r["payload"]["paper id"]) for r in vector_results]
-    keyword_ids = [str(r["id"]) for r in keyword_results]
-    all_doc_ids = list(set(vector_ids) | set(keyword_ids) | set(pr_scores.keys()) | set(velocity_scores.keys()))
+    all_doc_ids = list(vector_map.keys() | keyword_map.keys() | pr_scores.keys() | velocity_scores.keys())
 
     if not all_doc_ids:
         return []
 
-    # Prepare score arrays for standardization
-    vector_raw = [next((r.get("score", 0.0) for r in vector_results if str(r["payload"]["paper id"]) == doc_id), 0.0) for doc_id in all_doc_ids]
-    keyword_raw = [next((r.get("score", 0.0) for r in keyword_results if str(r["id"]) == doc_id), 0.0) for doc_id in all_doc_ids]
-    pr_raw = [pr_scores.get(doc_id, 0.0) for doc_id in all_doc_ids]
-    velocity_raw = [velocity_scores.get(doc_id, 0.0) for doc_id in all_doc_ids]
-
-    # Standardize to 0-100
-    vector_std = standardize_scores(vector_raw)
-    keyword_std = standardize_scores(keyword_raw)
-    pr_std = standardize_scores(pr_raw)
-    velocity_std = standardize_scores(velocity_raw)
+    # (4, N) raw scores: vector, keyword, pr, velocity
+    raw = np.array([
+        [vector_map.get(doc_id, 0.0) for doc_id in all_doc_ids],
+        [keyword_map.get(doc_id, 0.0) for doc_id in all_doc_ids],
+        [pr_scores.get(doc_id, 0.0) for doc_id in all_doc_ids],
+        [velocity_scores.get(doc_id, 0.0) for doc_id in all_doc_ids],
+    ], dtype=float)
+
+    # Standardize each row to 0-100 (same rule as standardize_scores)
+    row_max = raw.max(axis=1, keepdims=True)
+    std = np.where(row_max > 0, raw / np.where(row_max > 0, row_max, 1.0) * 100.0, 0.0)
+    combined = weights @ std
+
+    # Top-`limit` selection is O(N); only the selected slice gets sorted
+    if limit is not None and limit < len(combined):
+        if limit <= 0:
+            return []
+        top = np.argpartition(-combined, limit - 1)[:limit]
+    else:
+        top = np.arange(len(combined))
+    top = top[np.argsort(-combined[top], kind="stable")]
 
     final_results = []
-    for i, doc_id in enumerate(all_doc_ids):
-        v_s = vector_std[i]
-        k_s = keyword_std[i]
-        p_s = pr_std[i]
-        vel_s = velocity_std[i]
-
-        combined_score = (
-            weights["vector"] * v_s +
-            weights["keyword"] * k_s +
-            weights["pr"] * p_s +
-            weights["velocity"] * vel_s
-        )
-
+    for i in top:
+        doc_id = all_doc_ids[i]
         final_results.append({
             "id": doc_id,
-            "score": round(combined_score, 2),
-            "relevancy": round(v_s, 2),
-            "BM25": round(k_s, 2),
-            "pr_score": round(p_s, 2),
-            "velocity_score": round(vel_s, 2),
+            "score": round(float(combined[i]), 2),
+            "relevancy": round(float(std[0, i]), 2),
+            "BM25": round(float(std[1, i]), 2),
+            "pr_score": round(float(std[2, i]), 2),
+            "velocity_score": round(float(std[3, i]), 2),
         })
 
-    return sorted(final_results, key=lambda x: x["score"], reverse=True)
\ No newline at end of file
+    return final_results
\ No newline at end of file